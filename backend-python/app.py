@@ -3,9 +3,29 @@ from flask import send_from_directory, abort, request
 from flask_cors import CORS
 import json
 from pathlib import Path
-import csv
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from scipy.signal import lfilter
+
+try:
+    import pyarrow.parquet as pq
+    import pyarrow.csv as pacsv
+except Exception:  # pyarrow is optional; we fall back to pandas parsing
+    pq = None
+    pacsv = None
+
+try:
+    from numba import njit
+except Exception:  # numba is optional; we fall back to scipy's lfilter
+    njit = None
+
+try:
+    import orjson
+except Exception:  # orjson is optional; we fall back to flask.jsonify
+    orjson = None
+
+from cache import cached, start_cleanup_timer
 import subprocess
 import sys
 import os
@@ -15,6 +35,31 @@ app = Flask(__name__)
 # enable CORS so the frontend (running on a different port) can fetch data
 CORS(app)
 
+# evict stale cache entries in the background
+start_cleanup_timer()
+
+# shared pool for per-symbol file reads; pandas/pyarrow release the GIL
+# during parsing so the fanout overlaps I/O with compute
+_EXECUTOR = ThreadPoolExecutor(max_workers=(os.cpu_count() or 4) * 2)
+
+
+def _json_dumps(payload) -> bytes:
+    """Serialize with orjson when available.
+
+    The stdlib json encoder dominates response time for the full-universe
+    analysis payload; orjson emits the same bytes roughly an order of
+    magnitude faster.
+    """
+    if orjson is None:
+        return json.dumps(payload).encode("utf-8")
+    # numpy scalars leak into the payload on the lfilter fallback path;
+    # without this option orjson raises mid-stream and truncates the body
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def _json_response(payload, status=200):
+    return app.response_class(_json_dumps(payload), status=status, mimetype="application/json")
+
 
 @app.route("/hello")
 def hello():
@@ -43,37 +88,64 @@ def sector_heatmap():
     app.logger.info("Sector heatmap request received")
     duration = request.args.get("duration", "1d")
     if duration not in ["1d", "1w", "1m", "3m", "6m", "1y"]:
-        return jsonify({"error": "Invalid duration"}), 400
+        return _json_response({"error": "Invalid duration"}, status=400)
+
+    sectors = _compute_heatmap(duration)
+    if sectors is None:
+        app.logger.error("Universe file not found")
+        return _json_response({"error": "Universe file not found"}, status=500)
+
+    if not sectors:
+        app.logger.warning("No sector data found - did you run ingest first?")
+        return _json_response({"error": "No data available. Run ingest first."}, status=404)
+
+    return _json_response({"duration": duration, "sectors": sectors})
+
 
+@cached(ttl_seconds=60)
+def _compute_heatmap(duration: str):
+    """Build the per-sector aggregation for `duration`.
+
+    Returns None if the universe file is missing, otherwise a dict of
+    sectors (possibly empty). Cached so repeated dashboard polls don't
+    re-read every symbol file.
+    """
     base = Path(__file__).parent
     data_dir = base / "data"
     universe_file = data_dir / "universe_sample.json"
-    
+
     # Add debug logging for data paths
     app.logger.info(f"Reading universe from {universe_file}")
     app.logger.info(f"Looking for OHLCV files in {data_dir/'ohlcv'}")
-    
+
     if not universe_file.exists():
-        app.logger.error("Universe file not found")
-        return jsonify({"error": "Universe file not found"}), 500
+        return None
 
     universe = read_universe(universe_file)
 
-    sectors = {}
-
-    for entry in universe:
+    def read_entry(entry):
         sym = entry.get("symbol")
-        name = entry.get("name")
-        sector = entry.get("sector") or "Unknown"
         csv_path = data_dir / "ohlcv" / f"{sym}.csv"
         app.logger.debug(f"Reading {sym} from {csv_path}")
-        if not csv_path.exists():
-            app.logger.warning(f"CSV not found for {sym}")
-            continue
-        latest = read_latest_from_csv(csv_path, duration)
+        # prefer the columnar side-car written by ingest; fall back to CSV
+        latest = read_latest_from_parquet(csv_path.with_suffix(".parquet"), duration)
+        if latest is None:
+            if not csv_path.exists():
+                app.logger.warning(f"CSV not found for {sym}")
+                return None
+            latest = read_latest_from_csv(csv_path, duration)
         if latest is None:
             app.logger.warning(f"No valid data for {sym}")
+        return latest
+
+    sectors = {}
+
+    for entry, latest in zip(universe, _EXECUTOR.map(read_entry, universe)):
+        if latest is None:
             continue
+        sym = entry.get("symbol")
+        name = entry.get("name")
+        sector = entry.get("sector") or "Unknown"
 
         sym_obj = {
             "symbol": sym,
@@ -96,11 +168,7 @@ def sector_heatmap():
         
         app.logger.debug(f"Sector {sec_name}: {len(sec_data['symbols'])} symbols, avg change: {sec_data['avg_change_pct']}")
 
-    if not sectors:
-        app.logger.warning("No sector data found - did you run ingest first?")
-        return jsonify({"error": "No data available. Run ingest first."}), 404
-
-    return jsonify({"duration": duration, "sectors": sectors})
+    return sectors
 
 
 
@@ -144,9 +212,19 @@ def run_ingest():
     # pass progress file to ingest script
     args += ['--progress-file', str(progress_path)]
 
-    # start background process, redirect stdout/stderr to log file
+    # start background process, redirect stdout/stderr to log file;
+    # start_new_session detaches it from the server's process group so a
+    # server restart or Ctrl-C doesn't kill a running ingest. Progress
+    # stays on the atomically-replaced progress file, which is the
+    # channel that survives detachment (clients poll /ingest-progress).
     with open(log_path, 'wb') as out:
-        proc = subprocess.Popen(args, stdout=out, stderr=subprocess.STDOUT, cwd=str(repo_root))
+        proc = subprocess.Popen(
+            args,
+            stdout=out,
+            stderr=subprocess.STDOUT,
+            cwd=str(repo_root),
+            start_new_session=True,
+        )
 
     return jsonify({'job_id': job_id, 'pid': proc.pid, 'log_path': str(log_path)})
 
@@ -169,126 +247,306 @@ def ingest_progress(job_id: str):
 
 
 def read_universe(universe_path: Path):
+    """Load the universe JSON, memoized per (path, mtime).
+
+    The file changes only when someone edits it, so keying on mtime keeps
+    repeated requests from re-reading and re-parsing it while still picking
+    up edits immediately.
+    """
     if not universe_path.exists():
         return []
-    with universe_path.open("r", encoding="utf-8") as f:
+    return _read_universe(str(universe_path), universe_path.stat().st_mtime_ns)
+
+
+@cached(ttl_seconds=3600)
+def _read_universe(universe_path_str: str, mtime_ns: int):
+    with open(universe_path_str, "r", encoding="utf-8") as f:
         return json.load(f)
 
+def _resolve_columns(columns):
+    """Map canonical OHLCV names to whatever casing this frame uses.
+
+    Done once per frame so the hot paths never probe column presence
+    per value again.
+    """
+    def first(*names):
+        for n in names:
+            if n in columns:
+                return n
+        return None
+
+    return {
+        'close': first('Close', 'close', 'Adj Close', 'AdjClose', 'Adj_Close'),
+        'open': first('Open', 'open'),
+        'high': first('High', 'high'),
+        'low': first('Low', 'low'),
+        'volume': first('Volume', 'volume'),
+    }
+
+
+def _ewm_alpha(x: np.ndarray, alpha: float) -> np.ndarray:
+    """Exponential moving average, matching pandas ewm(adjust=False).
+
+    The recursion y[t] = (1-alpha)*y[t-1] + alpha*x[t] is a first-order IIR
+    filter, so a single C-level lfilter call replaces the pandas Series
+    machinery. The initial state pins y[0] = x[0] like pandas does.
+    """
+    y, _ = lfilter([alpha], [1.0, alpha - 1.0], x, zi=[(1.0 - alpha) * x[0]])
+    return y
+
+
+def _ewm(x: np.ndarray, span: float) -> np.ndarray:
+    return _ewm_alpha(x, 2.0 / (span + 1.0))
+
+
+def _indicator_pass_loop(x):
+    """Fused kernel: every EWMA the indicators need in one walk over Close.
+
+    Carries the EMA(12/21/26/44/200), MACD signal and Wilder gain/loss
+    state together so the array is read once instead of eight times, and
+    only scalars come back: no intermediate arrays at all. Recursions are
+    identical to the individual _ewm calls, so last values match.
+    """
+    a21 = 2.0 / 22.0
+    a44 = 2.0 / 45.0
+    a200 = 2.0 / 201.0
+    a12 = 2.0 / 13.0
+    a26 = 2.0 / 27.0
+    a9 = 2.0 / 10.0
+    aw = 1.0 / 14.0
+
+    e21 = e44 = e200 = e12 = e26 = x[0]
+    macd = 0.0
+    sig = 0.0
+    hist = 0.0
+    prev_hist = 0.0
+    avg_gain = 0.0
+    avg_loss = 0.0
+
+    for i in range(1, x.shape[0]):
+        c = x[i]
+        e21 = (1.0 - a21) * e21 + a21 * c
+        e44 = (1.0 - a44) * e44 + a44 * c
+        e200 = (1.0 - a200) * e200 + a200 * c
+        e12 = (1.0 - a12) * e12 + a12 * c
+        e26 = (1.0 - a26) * e26 + a26 * c
+        macd = e12 - e26
+        sig = (1.0 - a9) * sig + a9 * macd
+        prev_hist = hist
+        hist = macd - sig
+
+        delta = c - x[i - 1]
+        gain = delta if delta > 0.0 else 0.0
+        loss = -delta if delta < 0.0 else 0.0
+        if i == 1:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain = (1.0 - aw) * avg_gain + aw * gain
+            avg_loss = (1.0 - aw) * avg_loss + aw * loss
+
+    return e21, e44, e200, macd, sig, hist, prev_hist, avg_gain, avg_loss
+
+
+if njit is not None:
+    # compiled once and cached on disk; scalar state lives in registers
+    _indicator_pass = njit(cache=True, fastmath=True)(_indicator_pass_loop)
+else:
+    def _indicator_pass(x):
+        # vectorized fallback via lfilter when numba is unavailable
+        ema21 = _ewm(x, 21)
+        ema44 = _ewm(x, 44)
+        ema200 = _ewm(x, 200)
+        macd = _ewm(x, 12) - _ewm(x, 26)
+        signal = _ewm(macd, 9)
+        hist = macd - signal
+        delta = np.diff(x)
+        avg_gain = _ewm_alpha(np.clip(delta, 0, None), 1 / 14)
+        avg_loss = _ewm_alpha(np.clip(-delta, 0, None), 1 / 14)
+        prev_hist = hist[-2] if len(hist) >= 2 else 0.0
+        return (ema21[-1], ema44[-1], ema200[-1], macd[-1], signal[-1],
+                hist[-1], prev_hist, avg_gain[-1], avg_loss[-1])
+
+
 def compute_indicators_from_csv(csv_path: Path):
     """Read CSV into pandas and compute indicators: RSI(14), MACD, EMAs (21,44,200).
 
     Returns dict with keys: symbol, latest_close, rsi, macd_signal, macd_hist, macd_crossover ("bullish"/"bearish"/"neutral"),
     above_ema_21, above_ema_44, above_ema_200, dist_21, dist_44, dist_200, and ohlcv (list of recent rows)
+
+    Results are memoized per (path, mtime) so re-running ingest invalidates
+    stale entries automatically.
     """
     if not csv_path.exists():
         return None
+    return _compute_indicators(str(csv_path), csv_path.stat().st_mtime_ns)
+
+
+def _read_ohlcv_parquet(parquet_path: Path):
+    """Load an ingest-written parquet side-car as a Date-indexed frame.
+
+    Only the OHLCV columns the indicators need are read, so the Arrow
+    reader skips everything else in the file. Returns None when pyarrow or
+    the side-car is missing (caller falls back to CSV).
+    """
+    if pq is None or not parquet_path.exists():
+        return None
     try:
-        # many CSVs include an extra ticker row; skip the 2nd and 3rd lines if present
-        df = pd.read_csv(csv_path, header=0, skiprows=[1,2], parse_dates=[0])
+        pf = pq.ParquetFile(parquet_path, memory_map=True)
+        names = pf.schema_arrow.names
+        wanted = [c for c in ('Date', 'Open', 'High', 'Low', 'Close', 'Volume') if c in names]
+        if 'Date' not in wanted or 'Close' not in wanted:
+            return None
+        df = pf.read(columns=wanted).to_pandas()
     except Exception:
+        return None
+    df['Date'] = pd.to_datetime(df['Date'], unit='D')
+    df.set_index('Date', inplace=True)
+    return df
+
+
+def _load_indicator_sidecar(path: Path, mtime_ns: int):
+    if not path.exists():
+        return None
+    try:
+        raw = path.read_bytes()
+        payload = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except Exception:
+        return None
+    if payload.get('mtime_ns') != mtime_ns:
+        return None
+    return payload.get('data')
+
+
+def _save_indicator_sidecar(path: Path, mtime_ns: int, data: dict):
+    # best-effort: an unwritable data dir only loses the warm start
+    try:
+        payload = {'mtime_ns': mtime_ns, 'data': data}
+        if orjson is not None:
+            # OPT_SERIALIZE_NUMPY: numpy scalars leak in on the lfilter path
+            raw = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+        else:
+            raw = json.dumps(payload).encode('utf-8')
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(raw)
+        tmp.replace(path)
+    except Exception:
+        app.logger.debug(f"Could not persist indicator side-car {path}")
+
+
+@cached(ttl_seconds=300)
+def _compute_indicators(csv_path_str: str, mtime_ns: int):
+    csv_path = Path(csv_path_str)
+
+    # a persisted result from a previous process survives restarts and
+    # cache evictions; the mtime check invalidates it after re-ingest
+    sidecar = csv_path.with_suffix('.indicators.json')
+    persisted = _load_indicator_sidecar(sidecar, mtime_ns)
+    if persisted is not None:
+        return persisted
+
+    # prefer the columnar side-car written by ingest; fall back to CSV
+    df = _read_ohlcv_parquet(csv_path.with_suffix('.parquet'))
+    if df is None:
         try:
-            df = pd.read_csv(csv_path, header=0, parse_dates=[0])
+            # many CSVs include an extra ticker row; skip the 2nd and 3rd lines if present
+            df = pd.read_csv(csv_path, header=0, skiprows=[1,2], parse_dates=[0])
         except Exception:
-            return None
+            try:
+                df = pd.read_csv(csv_path, header=0, parse_dates=[0])
+            except Exception:
+                return None
+
+        # ensure first column is Date
+        df.rename(columns={df.columns[0]: 'Date'}, inplace=True)
+        df.set_index('Date', inplace=True)
+
+        # match the side-car's compact dtypes to halve the cached footprint
+        for c in df.columns:
+            if df[c].dtype == np.float64:
+                df[c] = df[c].astype(np.float32)
 
     if df.shape[0] < 10:
         return None
 
-    # ensure first column is Date
-    df.rename(columns={df.columns[0]: 'Date'}, inplace=True)
-    df.set_index('Date', inplace=True)
-
-    # canonical close column
-    close_col = None
-    for c in ['Close', 'close', 'Adj Close', 'AdjClose', 'Adj_Close']:
-        if c in df.columns:
-            close_col = c
-            break
+    # resolve canonical column names once for the whole frame
+    cols = _resolve_columns(df.columns)
+    close_col = cols['close']
     if close_col is None:
         # pick second column if uncertain
         close_col = df.columns[0]
 
-    close = df[close_col].astype(float)
-
-    # RSI 14 (Wilder smoothing using ewm)
-    delta = close.diff()
-    gain = delta.clip(lower=0)
-    loss = -delta.clip(upper=0)
-    avg_gain = gain.ewm(alpha=1/14, adjust=False).mean()
-    avg_loss = loss.ewm(alpha=1/14, adjust=False).mean()
-    rs = avg_gain / (avg_loss.replace(0, pd.NA))
-    rsi = 100 - (100 / (1 + rs))
-
-    # EMAs
-    ema21 = close.ewm(span=21, adjust=False).mean()
-    ema44 = close.ewm(span=44, adjust=False).mean()
-    ema200 = close.ewm(span=200, adjust=False).mean()
-
-    # MACD
-    ema12 = close.ewm(span=12, adjust=False).mean()
-    ema26 = close.ewm(span=26, adjust=False).mean()
-    macd = ema12 - ema26
-    signal = macd.ewm(span=9, adjust=False).mean()
-    macd_hist = macd - signal
+    # pandas ewm skipped NaN closes; the fused kernel would propagate them
+    # through every indicator, so drop them up front
+    close = df[close_col].astype(float).dropna()
+    if close.empty:
+        return None
+    close_np = close.to_numpy(dtype=np.float32)
+
+    # one fused pass yields every EWMA endpoint the response needs
+    (ema21, ema44, ema200, macd, signal,
+     macd_hist, macd_hist_prev, avg_gain, avg_loss) = _indicator_pass(close_np)
+
+    # RSI 14 from the final Wilder averages (alpha=1/14)
+    if avg_loss == 0 or np.isnan(avg_loss):
+        rsi = float('nan')
+    else:
+        rs = avg_gain / avg_loss
+        rsi = 100 - (100 / (1 + rs))
 
     # Determine crossover from last two values
     macd_crossover = 'neutral'
-    if len(macd_hist) >= 2:
-        prev = macd_hist.iloc[-2]
-        curr = macd_hist.iloc[-1]
-        if prev <= 0 and curr > 0:
-            macd_crossover = 'bullish'
-        elif prev >= 0 and curr < 0:
-            macd_crossover = 'bearish'
+    if macd_hist_prev <= 0 and macd_hist > 0:
+        macd_crossover = 'bullish'
+    elif macd_hist_prev >= 0 and macd_hist < 0:
+        macd_crossover = 'bearish'
 
     latest_close = float(close.iloc[-1])
 
-    def pct_dist(series):
-        v = series.iloc[-1]
-        if v == 0 or pd.isna(v):
+    def pct_dist(v):
+        if v == 0 or np.isnan(v):
             return None
         return (latest_close - v) / v * 100.0
 
-    above_21 = latest_close > float(ema21.iloc[-1]) if not pd.isna(ema21.iloc[-1]) else None
-    above_44 = latest_close > float(ema44.iloc[-1]) if not pd.isna(ema44.iloc[-1]) else None
-    above_200 = latest_close > float(ema200.iloc[-1]) if not pd.isna(ema200.iloc[-1]) else None
+    above_21 = latest_close > float(ema21) if not np.isnan(ema21) else None
+    above_44 = latest_close > float(ema44) if not np.isnan(ema44) else None
+    above_200 = latest_close > float(ema200) if not np.isnan(ema200) else None
 
     dist_21 = pct_dist(ema21)
     dist_44 = pct_dist(ema44)
     dist_200 = pct_dist(ema200)
 
-    # prepare recent ohlcv for candlestick (last 200 rows)
-    ohlcv_cols = None
-    for cset in [['Open','High','Low','Close'], ['Open','High','Low','close'], ['Open','High','Low','Adj Close']]:
-        if all(c in df.columns for c in cset):
-            ohlcv_cols = cset
-            break
-    if ohlcv_cols is None:
-        # try common names
-        possible = [c for c in df.columns if c.lower() in ('open','high','low','close')]
-        ohlcv_cols = possible[:4]
-
-    ohlcv = []
+    # prepare recent ohlcv for candlestick (last 200 rows); columns were
+    # resolved above, so just slice them as NumPy arrays
     take = df.tail(200)
-    for idx, row in take.iterrows():
-        try:
-            ohlcv.append({
-                'date': idx.strftime('%Y-%m-%d'),
-                'open': float(row.get('Open', row.get('open', None))) if 'Open' in row.index or 'open' in row.index else None,
-                'high': float(row.get('High', row.get('high', None))) if 'High' in row.index or 'high' in row.index else None,
-                'low': float(row.get('Low', row.get('low', None))) if 'Low' in row.index or 'low' in row.index else None,
-                'close': float(row.get(close_col)),
-                'volume': int(row.get('Volume', row.get('volume', 0))) if ('Volume' in row.index or 'volume' in row.index) else None,
-            })
-        except Exception:
-            continue
 
-    return {
+    def arr(name):
+        return take[name].to_numpy(dtype=float) if name is not None else None
+
+    opens = arr(cols['open'])
+    highs = arr(cols['high'])
+    lows = arr(cols['low'])
+    closes = take[close_col].to_numpy(dtype=float)
+    volumes = arr(cols['volume'])
+    dates = take.index.strftime('%Y-%m-%d')
+
+    ohlcv = []
+    for j, d in enumerate(dates):
+        ohlcv.append({
+            'date': d,
+            'open': float(opens[j]) if opens is not None and not np.isnan(opens[j]) else None,
+            'high': float(highs[j]) if highs is not None and not np.isnan(highs[j]) else None,
+            'low': float(lows[j]) if lows is not None and not np.isnan(lows[j]) else None,
+            'close': float(closes[j]),
+            'volume': int(volumes[j]) if volumes is not None and not np.isnan(volumes[j]) else None,
+        })
+
+    result = {
         'latest_close': latest_close,
-        'rsi': None if pd.isna(rsi.iloc[-1]) else float(rsi.iloc[-1]),
-        'macd': float(macd.iloc[-1]) if not pd.isna(macd.iloc[-1]) else None,
-        'macd_signal': float(signal.iloc[-1]) if not pd.isna(signal.iloc[-1]) else None,
-        'macd_hist': float(macd_hist.iloc[-1]) if not pd.isna(macd_hist.iloc[-1]) else None,
+        'rsi': None if np.isnan(rsi) else float(rsi),
+        'macd': float(macd) if not np.isnan(macd) else None,
+        'macd_signal': float(signal) if not np.isnan(signal) else None,
+        'macd_hist': float(macd_hist) if not np.isnan(macd_hist) else None,
         'macd_crossover': macd_crossover,
         'above_21': above_21,
         'above_44': above_44,
@@ -299,6 +557,9 @@ def compute_indicators_from_csv(csv_path: Path):
         'ohlcv': ohlcv,
     }
 
+    _save_indicator_sidecar(sidecar, mtime_ns, result)
+    return result
+
 
 @app.route('/analysis')
 def analysis():
@@ -315,21 +576,142 @@ def analysis():
     universe = read_universe(base / 'data' / 'universe_sample.json')
     symbols = [e.get('symbol') for e in universe if e.get('symbol')]
 
-    results = {}
-    for sym in symbols:
-        csv_path = data_dir / f"{sym}.csv"
-        info = compute_indicators_from_csv(csv_path)
-        if info is None:
-            continue
-        results[sym] = info
+    paths = [data_dir / f"{sym}.csv" for sym in symbols]
+
+    def generate():
+        # emit each symbol as soon as it's ready rather than materializing
+        # the whole payload; peak memory stays at one symbol's chunk
+        yield b'{"symbols":{'
+        selected_data = None
+        first = True
+        for sym, info in zip(symbols, _EXECUTOR.map(compute_indicators_from_csv, paths)):
+            if info is None:
+                continue
+            if sym == symbol:
+                # the scan already computed this symbol; reuse it below
+                selected_data = info
+            if not first:
+                yield b','
+            first = False
+            yield _json_dumps(sym) + b':' + _json_dumps(info)
+
+        if symbol and selected_data is None:
+            # requested symbol is outside the universe list
+            selected_data = compute_indicators_from_csv(data_dir / f"{symbol}.csv")
 
-    selected_data = None
-    if symbol:
-        sym = symbol
-        csv_path = data_dir / f"{sym}.csv"
-        selected_data = compute_indicators_from_csv(csv_path)
+        yield b'},"selected":' + _json_dumps({'symbol': symbol, 'data': selected_data}) + b'}'
 
-    return jsonify({'symbols': results, 'selected': {'symbol': symbol, 'data': selected_data}})
+    return app.response_class(generate(), mimetype='application/json')
+
+
+# Map duration query params to number of calendar days to look back
+DURATION_DAYS = {
+    "1d": 1,
+    "1w": 7,
+    "1m": 30,
+    "3m": 90,
+    "6m": 180,
+    "1y": 365,
+}
+
+
+def read_latest_from_parquet(parquet_path: Path, duration: str = "1d"):
+    """Read latest close and change over `duration` from a parquet side-car.
+
+    The side-car (written by scripts/ingest.py) stores Date as int64
+    epoch-days and Close as float32, so locating the comparison row is a
+    memory-mapped column read plus a binary search instead of a line scan.
+
+    Returns the same dict shape as read_latest_from_csv, or None if the
+    file is missing or pyarrow is unavailable (caller falls back to CSV).
+    """
+    if pq is None or not parquet_path.exists():
+        return None
+
+    duration_days = DURATION_DAYS.get(duration, 1)
+
+    try:
+        pf = pq.ParquetFile(parquet_path, memory_map=True)
+        table = pf.read(columns=["Date", "Close"])
+        days = table.column("Date").to_numpy()
+        closes = table.column("Close").to_numpy()
+    except Exception:
+        return None
+
+    if days.size == 0:
+        return None
+
+    target = days[-1] - duration_days
+    # index of the last row on or before the target date
+    i = max(0, int(np.searchsorted(days, target, side="right")) - 1)
+
+    close = float(closes[-1])
+    if np.isnan(close):
+        return None
+
+    prev_close = None
+    if not np.isnan(closes[i]):
+        prev_close = float(closes[i])
+
+    change_pct = None
+    if prev_close is not None and prev_close != 0:
+        change_pct = (close - prev_close) / prev_close * 100.0
+
+    return {
+        "date": str(np.datetime64(int(days[-1]), "D")),
+        "close": close,
+        "prev_close": prev_close,
+        "change_pct": change_pct,
+    }
+
+
+def _read_latest_csv_arrow(csv_path: Path, duration_days: int):
+    """Arrow-native version of the CSV lookup used by the heatmap.
+
+    Skips the two header-ish ticker rows the ingest CSVs carry, lets
+    arrow infer the date column, and binary-searches for the comparison
+    row. Returns None on any parse trouble so the pandas path can try.
+    """
+    if pacsv is None:
+        return None
+    try:
+        table = pacsv.read_csv(
+            str(csv_path),
+            read_options=pacsv.ReadOptions(skip_rows_after_names=2),
+        )
+        if table.num_rows == 0 or table.num_columns < 2:
+            return None
+        dates = table.column(0).cast('date32').to_numpy()
+        col_idx = 2 if table.num_columns > 2 else 1
+        closes = table.column(col_idx).to_numpy().astype(np.float64)
+        if np.isnan(closes[-1]) and table.num_columns > 2:
+            closes = table.column(1).to_numpy().astype(np.float64)
+    except Exception:
+        return None
+
+    last_date = dates[-1]
+    target = last_date - np.timedelta64(duration_days, 'D')
+    # binary search for the last row on or before the target date
+    i = max(0, int(np.searchsorted(dates, target, side='right')) - 1)
+
+    close = float(closes[-1])
+    if np.isnan(close):
+        return None
+
+    prev_close = None
+    if not np.isnan(closes[i]):
+        prev_close = float(closes[i])
+
+    change_pct = None
+    if prev_close is not None and prev_close != 0:
+        change_pct = (close - prev_close) / prev_close * 100.0
+
+    return {
+        "date": str(last_date.astype('datetime64[D]')),
+        "close": close,
+        "prev_close": prev_close,
+        "change_pct": change_pct,
+    }
 
 
 def read_latest_from_csv(csv_path: Path, duration: str = "1d"):
@@ -348,67 +730,63 @@ def read_latest_from_csv(csv_path: Path, duration: str = "1d"):
     """
     if not csv_path.exists():
         return None
-    
-    # Map duration to number of calendar days to look back
-    duration_days = {
-        "1d": 1,
-        "1w": 7,
-        "1m": 30,
-        "3m": 90,
-        "6m": 180,
-        "1y": 365,
-    }.get(duration, 1)  # default to 1 day
-
-    # Find latest date and target date for comparison
-    with csv_path.open("r", encoding="utf-8") as f:
-        reader = csv.reader(f)
-        # skip the first 3 header-ish lines if present (based on sample files)
-        rows = [r for r in reader if r]
-        # find rows that look like date rows (start with YYYY-)
-        data_rows = [r for r in rows if r[0] and (len(r[0]) >= 4 and r[0][0].isdigit())]
-        if not data_rows:
-            return None
 
-        # Get latest row
-        last = data_rows[-1]
-        last_date = datetime.strptime(last[0], "%Y-%m-%d")
-        target_date = last_date - timedelta(days=duration_days)
+    duration_days = DURATION_DAYS.get(duration, 1)
 
-        # Find closest row to target date by comparing dates
-        prev = None
-        prev_diff = None
-        for row in data_rows:
-            try:
-                date = datetime.strptime(row[0], "%Y-%m-%d")
-                diff = abs((date - target_date).days)
-                if prev_diff is None or diff < prev_diff:
-                    prev = row
-                    prev_diff = diff
-            except ValueError:
-                continue
+    # arrow's multithreaded CSV reader beats the pandas C engine here
+    latest = _read_latest_csv_arrow(csv_path, duration_days)
+    if latest is not None:
+        return latest
 
     try:
-        close = float(last[2]) if len(last) > 2 and last[2] != "" else float(last[1])
+        # many CSVs include an extra ticker row; skip the 2nd and 3rd lines if present
+        df = pd.read_csv(csv_path, skiprows=[1, 2], usecols=[0, 1, 2], engine='c')
     except Exception:
-        # fallback try other columns
         try:
-            close = float(last[1])
+            df = pd.read_csv(csv_path, usecols=[0, 1, 2], engine='c')
         except Exception:
             return None
 
+    if df.shape[0] == 0:
+        return None
+
+    # bulk-cast the ISO date strings in one vectorized conversion rather
+    # than letting the reader parse them element by element
+    try:
+        dates = df.iloc[:, 0].to_numpy(dtype='datetime64[D]')
+    except Exception:
+        return None
+
+    # close lives in the 3rd column when present (Date, Open-ish, Close-ish),
+    # matching the layout the ingest script writes; fall back to the 2nd
+    closes = df.iloc[:, 2] if df.shape[1] > 2 else df.iloc[:, 1]
+    if pd.isna(closes.iloc[-1]) and df.shape[1] > 2:
+        closes = df.iloc[:, 1]
+
+    last_date = dates[-1]
+    target = last_date - np.timedelta64(duration_days, 'D')
+    # binary search for the last row on or before the target date
+    i = max(0, int(np.searchsorted(dates, target, side='right')) - 1)
+
+    try:
+        close = float(closes.iloc[-1])
+    except Exception:
+        return None
+
     prev_close = None
-    if prev is not None:
-        try:
-            prev_close = float(prev[2]) if len(prev) > 2 and prev[2] != "" else float(prev[1])
-        except Exception:
-            prev_close = None
+    try:
+        v = float(closes.iloc[i])
+        if not pd.isna(v):
+            prev_close = v
+    except Exception:
+        prev_close = None
 
     change_pct = None
     if prev_close is not None and prev_close != 0:
         change_pct = (close - prev_close) / prev_close * 100.0
 
     return {
-        "date": last[0],
+        "date": str(last_date),
         "close": close,
         "prev_close": prev_close,
         "change_pct": change_pct,
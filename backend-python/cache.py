@@ -1,32 +1,84 @@
+from collections import OrderedDict
 from functools import wraps
+import heapq
+import os
+import pickle
+import threading
 import time
-import pandas as pd
 
-# Simple in-memory cache with TTL
-cache = {}
+# In-memory TTL cache: LRU-capped OrderedDict plus an expiry heap so
+# cleanup pops only entries that are actually due, instead of scanning
+# every key. Guarded by a lock since request handlers run on threads.
+# The cap must sit comfortably above the universe size (~500 symbols for
+# the shipped nifty500 list, one indicator entry each) or a single full
+# /analysis scan would churn the whole cache and defeat the memoization.
+MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", 2048))
+
+cache = OrderedDict()
+_expiry_heap = []  # (expires_at, key); stale records are skipped lazily
+_lock = threading.RLock()
+
+def _make_key(func_name, args, kwargs):
+    """Build a hashable cache key without string formatting.
+
+    A tuple of the actual arguments avoids both repr() cost and
+    collisions between distinct values with equal reprs; unhashable
+    arguments fall back to their pickle bytes.
+    """
+    key = (func_name, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+        return key
+    except TypeError:
+        return (func_name, pickle.dumps((args, kwargs)))
 
 def cached(ttl_seconds=60):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            cache_key = f"{func.__name__}:{args}:{kwargs}"
+            cache_key = _make_key(func.__name__, args, kwargs)
             now = time.time()
-            
-            if cache_key in cache:
-                result, timestamp = cache[cache_key]
-                if now - timestamp < ttl_seconds:
-                    return result
-            
+
+            with _lock:
+                if cache_key in cache:
+                    result, expires_at = cache[cache_key]
+                    if now < expires_at:
+                        cache.move_to_end(cache_key)
+                        return result
+                    del cache[cache_key]
+
             result = func(*args, **kwargs)
-            cache[cache_key] = (result, now)
+
+            with _lock:
+                expires_at = time.time() + ttl_seconds
+                cache[cache_key] = (result, expires_at)
+                cache.move_to_end(cache_key)
+                heapq.heappush(_expiry_heap, (expires_at, cache_key))
+                while len(cache) > MAX_ENTRIES:
+                    cache.popitem(last=False)
             return result
-            
+
         return wrapper
     return decorator
 
 # Clean expired cache entries periodically
-def clean_cache(max_age_seconds=300):
+def clean_cache():
     now = time.time()
-    expired = [k for k, (_, ts) in cache.items() if now - ts > max_age_seconds]
-    for k in expired:
-        del cache[k]
\ No newline at end of file
+    with _lock:
+        while _expiry_heap and _expiry_heap[0][0] <= now:
+            expires_at, key = heapq.heappop(_expiry_heap)
+            entry = cache.get(key)
+            # skip heap records for keys that were refreshed or LRU-evicted
+            if entry is not None and entry[1] == expires_at:
+                del cache[key]
+
+def start_cleanup_timer(interval_seconds=300):
+    """Run clean_cache every `interval_seconds` on a daemon timer."""
+    def _tick():
+        clean_cache()
+        start_cleanup_timer(interval_seconds)
+
+    timer = threading.Timer(interval_seconds, _tick)
+    timer.daemon = True
+    timer.start()
+    return timer
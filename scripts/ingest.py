@@ -10,7 +10,9 @@ import argparse
 import json
 import logging
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List
 from tempfile import NamedTemporaryFile
@@ -57,6 +59,39 @@ def save_df(df: pd.DataFrame, out_path: Path) -> None:
         return
     out_path.parent.mkdir(parents=True, exist_ok=True)
     df.to_csv(out_path)
+    save_parquet(df, out_path.with_suffix(".parquet"))
+
+
+def save_parquet(df: pd.DataFrame, out_path: Path) -> None:
+    """Write a columnar side-car next to the CSV for the API's hot path.
+
+    Stores Date as int64 epoch-days plus the OHLCV columns, with Close as
+    float32, so the backend can memory-map the file and read only the
+    columns a given endpoint needs instead of re-parsing text. Best-effort:
+    skipped with a warning if pyarrow is unavailable.
+    """
+    try:
+        frame = df
+        if isinstance(frame.columns, pd.MultiIndex):
+            # yfinance returns a (field, ticker) MultiIndex; keep the field level
+            frame = frame.copy()
+            frame.columns = frame.columns.get_level_values(0)
+        close_col = "Close" if "Close" in frame.columns else frame.columns[0]
+        data = {
+            # unit-independent: works for ns- and us-resolution indexes
+            "Date": frame.index.values.astype("datetime64[D]").astype("int64"),
+        }
+        # float32 keeps full price precision at half the footprint; Volume
+        # stays int64 since heavily traded symbols exceed 2^31 shares a day
+        for name in ("Open", "High", "Low"):
+            if name in frame.columns:
+                data[name] = frame[name].astype("float32").to_numpy()
+        data["Close"] = frame[close_col].astype("float32").to_numpy()
+        if "Volume" in frame.columns:
+            data["Volume"] = frame["Volume"].fillna(0).astype("int64").to_numpy()
+        pd.DataFrame(data).to_parquet(out_path, engine="pyarrow", compression=None)
+    except Exception:
+        LOG.warning("Could not write parquet side-car %s", out_path.name)
 
 
 def main(argv: List[str] | None = None) -> int:
@@ -107,7 +142,13 @@ def main(argv: List[str] | None = None) -> int:
         "--sleep",
         type=float,
         default=0.25,
-        help="Seconds to wait between downloads (default 0.25)",
+        help="Seconds each worker waits between downloads (default 0.25)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of concurrent download threads (default 4)",
     )
     parser.add_argument(
         "--progress-file",
@@ -216,23 +257,35 @@ def main(argv: List[str] | None = None) -> int:
     total = len(symbols)
     write_progress({"total": total, "done": 0, "current": None, "status": "running"})
 
-    for i, sym in enumerate(tqdm(symbols, desc="symbols")):
+    # downloads are network-bound, so a small bounded pool overlaps them;
+    # the per-worker sleep keeps the aggregate request rate polite
+    progress_lock = threading.Lock()
+    done = 0
+
+    def process_symbol(sym: str) -> None:
+        nonlocal done
         try:
             df = download_symbol(sym, start=args.start, end=args.end)
         except Exception as exc:
             LOG.exception("Failed to download %s: %s", sym, exc)
-            continue
+            df = None
+
+        if df is not None:
+            out_path = out_dir / f"{sym}.csv"
+            try:
+                save_df(df, out_path)
+            except Exception:
+                LOG.exception("Failed to save data for %s", sym)
 
-        out_path = out_dir / f"{sym}.csv"
-        try:
-            save_df(df, out_path)
-        except Exception:
-            LOG.exception("Failed to save data for %s", sym)
         # update progress after each symbol
-        done = i + 1
-        write_progress({"total": total, "done": done, "current": sym, "status": "running"})
+        with progress_lock:
+            done += 1
+            write_progress({"total": total, "done": done, "current": sym, "status": "running"})
         time.sleep(args.sleep)
 
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        list(tqdm(pool.map(process_symbol, symbols), total=total, desc="symbols"))
+
     LOG.info("Download finished. Files saved to %s", out_dir)
     write_progress({"total": total, "done": total, "current": None, "status": "finished"})
     return 0